@@ -11,6 +11,8 @@ const dbPath = path.join(dataDir, 'werkstatt.db');
 const db = new Database(dbPath);
 
 db.pragma('journal_mode = WAL');
+db.pragma('synchronous = NORMAL');
+db.pragma('temp_store = MEMORY');
 db.pragma('foreign_keys = ON');
 
 db.exec(`
@@ -40,12 +42,17 @@ db.exec(`
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
   );
 
+  CREATE INDEX IF NOT EXISTS idx_jobs_date_time ON jobs (date, time);
+  CREATE INDEX IF NOT EXISTS idx_attachments_job_id ON attachments (job_id);
+
   CREATE TABLE IF NOT EXISTS clipboard (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     title TEXT NOT NULL,
     notes TEXT NOT NULL,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
   );
+
+  CREATE INDEX IF NOT EXISTS idx_clipboard_created_at ON clipboard (created_at DESC, id DESC);
 `);
 
 module.exports = db;
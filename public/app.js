@@ -22,6 +22,18 @@ const CATEGORY_CONFIG = {
 
 const CATEGORY_ORDER = Object.keys(CATEGORY_CONFIG);
 
+const DATE_FORMATS = {
+  long: new Intl.DateTimeFormat('de-DE', {
+    weekday: 'long',
+    year: 'numeric',
+    month: 'long',
+    day: 'numeric',
+  }),
+  weekday: new Intl.DateTimeFormat('de-DE', { weekday: 'short' }),
+  dayMonth: new Intl.DateTimeFormat('de-DE', { day: '2-digit', month: '2-digit' }),
+  short: new Intl.DateTimeFormat('de-DE'),
+};
+
 const dayView = document.getElementById('day-view');
 const weekView = document.getElementById('week-view');
 const selectedDateLabel = document.getElementById('selected-date-label');
@@ -40,11 +52,13 @@ const state = {
   jobsByDay: new Map(),
   jobsById: new Map(),
   clipboard: [],
+  pendingStatusIds: new Set(),
 };
 
 let currentDate = new Date();
 let editingJobId = null;
 let editingJobSnapshot = null;
+let renderFrame = null;
 
 const api = {
   listJobs: () => apiRequest('/api/jobs'),
@@ -100,19 +114,21 @@ function bindUI() {
   document.getElementById('prev-day').addEventListener('click', () => changeDay(-1));
   document.getElementById('next-day').addEventListener('click', () => changeDay(1));
   document.getElementById('today-btn').addEventListener('click', () => {
-    currentDate = new Date();
-    render();
+    const today = new Date();
+    if (formatDateKey(today) === formatDateKey(currentDate)) return;
+    currentDate = today;
+    scheduleRender();
   });
   document
     .getElementById('new-job-btn')
-    .addEventListener('click', () => openJobModal({ date: formatDateInput(currentDate) }));
+    .addEventListener('click', () => openJobModal({ date: formatDateKey(currentDate) }));
   document
     .getElementById('add-clipboard-item')
     .addEventListener('click', () => openClipboardModal());
 
   jobForm.addEventListener('submit', handleJobSubmit);
   clipboardForm.addEventListener('submit', handleClipboardSubmit);
-  fileInput.addEventListener('change', handleFileInput);
+  fileInput.addEventListener('change', renderAttachmentPreview);
 
   document.querySelectorAll('[data-close-modal]').forEach((button) => {
     button.addEventListener('click', closeModals);
@@ -127,20 +143,30 @@ function bindUI() {
 
 function render() {
   renderHeader();
-  renderDayView();
-  renderWeekView();
+  renderActiveView();
   renderClipboard();
 }
 
-function renderHeader() {
-  selectedDateLabel.textContent = currentDate.toLocaleDateString('de-DE', {
-    weekday: 'long',
-    year: 'numeric',
-    month: 'long',
-    day: 'numeric',
+function renderActiveView() {
+  if (weekView.classList.contains('hidden')) {
+    renderDayView();
+  } else {
+    renderWeekView();
+  }
+}
+
+function scheduleRender() {
+  if (renderFrame !== null) return;
+  renderFrame = requestAnimationFrame(() => {
+    renderFrame = null;
+    render();
   });
 }
 
+function renderHeader() {
+  selectedDateLabel.textContent = DATE_FORMATS.long.format(currentDate);
+}
+
 function renderDayView() {
   const dayColumns = document.createElement('div');
   dayColumns.className = 'day-columns';
@@ -162,7 +188,7 @@ function renderDayView() {
     addButton.textContent = 'Auftrag hinzufügen';
     addButton.disabled = !available;
     addButton.addEventListener('click', () =>
-      openJobModal({ date: formatDateInput(currentDate), category }),
+      openJobModal({ date: formatDateKey(currentDate), category }),
     );
 
     header.appendChild(title);
@@ -186,8 +212,7 @@ function renderDayView() {
     dayColumns.appendChild(column);
   });
 
-  dayView.innerHTML = '';
-  dayView.appendChild(dayColumns);
+  dayView.replaceChildren(dayColumns);
 }
 
 function renderWeekView() {
@@ -204,18 +229,15 @@ function renderWeekView() {
 
     const header = document.createElement('header');
     const title = document.createElement('h3');
-    title.textContent = day.toLocaleDateString('de-DE', { weekday: 'short' });
+    title.textContent = DATE_FORMATS.weekday.format(day);
     const label = document.createElement('small');
-    label.textContent = day.toLocaleDateString('de-DE', {
-      day: '2-digit',
-      month: '2-digit',
-    });
+    label.textContent = DATE_FORMATS.dayMonth.format(day);
 
     const addButton = document.createElement('button');
     addButton.className = 'ghost-button small';
     addButton.type = 'button';
     addButton.textContent = '+';
-    addButton.addEventListener('click', () => openJobModal({ date: formatDateInput(day) }));
+    addButton.addEventListener('click', () => openJobModal({ date: formatDateKey(day) }));
 
     header.appendChild(title);
     header.appendChild(label);
@@ -245,11 +267,13 @@ function renderWeekView() {
         jobs.forEach((job) => {
           const jobElement = document.createElement('div');
           jobElement.className = 'week-job';
-          jobElement.innerHTML = `
-            <strong>${job.title}</strong>
-            <span>${job.time || 'Ganztägig'}</span>
-            <span>${job.customer || 'Kunde unbekannt'}</span>
-          `;
+          const jobTitle = document.createElement('strong');
+          jobTitle.textContent = job.title;
+          const jobTime = document.createElement('span');
+          jobTime.textContent = job.time || 'Ganztägig';
+          const jobCustomer = document.createElement('span');
+          jobCustomer.textContent = job.customer || 'Kunde unbekannt';
+          jobElement.append(jobTitle, jobTime, jobCustomer);
           jobElement.addEventListener('click', () => openDetailModal(job));
           column.appendChild(jobElement);
         });
@@ -263,25 +287,21 @@ function renderWeekView() {
     weekRow.appendChild(weekDay);
   }
 
-  weekView.innerHTML = '';
-  weekView.appendChild(weekRow);
+  weekView.replaceChildren(weekRow);
 }
 
 function renderClipboard() {
-  clipboardList.innerHTML = '';
   if (!state.clipboard.length) {
     const empty = document.createElement('div');
     empty.className = 'empty-state';
     empty.textContent = 'Hier können Sie Aufgaben oder Notizen ablegen.';
-    clipboardList.appendChild(empty);
+    clipboardList.replaceChildren(empty);
     return;
   }
 
-  const items = [...state.clipboard].sort((a, b) =>
-    new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime(),
-  );
+  const fragment = document.createDocumentFragment();
 
-  items.forEach((item) => {
+  state.clipboard.forEach((item) => {
     const card = document.createElement('article');
     card.className = 'clipboard-card';
 
@@ -312,8 +332,10 @@ function renderClipboard() {
 
     card.appendChild(header);
     card.appendChild(body);
-    clipboardList.appendChild(card);
+    fragment.appendChild(card);
   });
+
+  clipboardList.replaceChildren(fragment);
 }
 
 function createJobCard(job) {
@@ -328,14 +350,12 @@ function createJobCard(job) {
   element.querySelector('.job-notes').textContent = job.notes || '';
 
   const statusToggle = element.querySelector('.status-toggle');
-  statusToggle.dataset.status = job.status;
-  statusToggle.title = STATUS_LABELS[job.status];
-  statusToggle.style.background = statusColor(job.status);
-  statusToggle.addEventListener('click', () => cycleJobStatus(job));
+  applyStatusToggle(statusToggle, job.status);
+  statusToggle.addEventListener('click', () => cycleJobStatus(job.id));
   statusToggle.addEventListener('keydown', (event) => {
     if (event.key === 'Enter' || event.key === ' ') {
       event.preventDefault();
-      cycleJobStatus(job);
+      cycleJobStatus(job.id);
     }
   });
 
@@ -350,16 +370,28 @@ function createJobCard(job) {
   return element;
 }
 
-async function cycleJobStatus(job) {
+function applyStatusToggle(statusToggle, status) {
+  statusToggle.dataset.status = status;
+  statusToggle.title = STATUS_LABELS[status];
+  statusToggle.style.background = statusColor(status);
+}
+
+async function cycleJobStatus(jobId) {
+  const job = findJob(jobId);
+  if (!job || state.pendingStatusIds.has(job.id)) return;
   const currentIndex = STATUS_SEQUENCE.indexOf(job.status);
   const nextStatus = STATUS_SEQUENCE[(currentIndex + 1) % STATUS_SEQUENCE.length];
+  state.pendingStatusIds.add(job.id);
   try {
     const updated = await api.updateJobStatus(job.id, nextStatus);
     upsertJob(updated);
-    render();
+    const card = dayView.querySelector(`[data-job-id="${updated.id}"]`);
+    if (card) applyStatusToggle(card.querySelector('.status-toggle'), updated.status);
   } catch (error) {
     console.error(error);
     alert(error.message || 'Status konnte nicht aktualisiert werden.');
+  } finally {
+    state.pendingStatusIds.delete(job.id);
   }
 }
 
@@ -368,7 +400,7 @@ async function handleJobSubmit(event) {
   const formData = new FormData(jobForm);
 
   const payload = {
-    date: formData.get('date') || formatDateInput(currentDate),
+    date: formData.get('date') || formatDateKey(currentDate),
     time: formData.get('time')?.trim() || '',
     category: formData.get('category') || 'routine',
     title: formData.get('title')?.trim() || '',
@@ -422,9 +454,9 @@ async function handleJobSubmit(event) {
     if (clipboardRequested) {
       const clipboardItem = await api.createClipboard({
         title: job.title,
-        notes: `${job.customer || 'Kunde'} • ${new Date(job.date).toLocaleDateString('de-DE')}`,
+        notes: `${job.customer || 'Kunde'} • ${DATE_FORMATS.short.format(new Date(job.date))}`,
       });
-      state.clipboard.push(clipboardItem);
+      state.clipboard.unshift(clipboardItem);
     }
 
     closeModals();
@@ -445,7 +477,7 @@ async function handleClipboardSubmit(event) {
 
   try {
     const item = await api.createClipboard(payload);
-    state.clipboard.push(item);
+    state.clipboard.unshift(item);
     closeModals();
     renderClipboard();
   } catch (error) {
@@ -454,12 +486,8 @@ async function handleClipboardSubmit(event) {
   }
 }
 
-function handleFileInput() {
-  renderAttachmentPreview();
-}
-
 function renderAttachmentPreview() {
-  filePreview.innerHTML = '';
+  const fragment = document.createDocumentFragment();
   const existing = editingJobSnapshot?.attachments || [];
   const hasNewFiles = fileInput.files.length > 0;
 
@@ -481,36 +509,38 @@ function renderAttachmentPreview() {
       currentBlock.appendChild(link);
     });
 
-    filePreview.appendChild(currentBlock);
+    fragment.appendChild(currentBlock);
 
     if (hasNewFiles) {
       const hint = document.createElement('p');
       hint.className = 'help-text';
       hint.textContent = 'Neue Dateien ersetzen die bestehenden Anhänge.';
-      filePreview.appendChild(hint);
+      fragment.appendChild(hint);
     }
   }
 
-  if (!hasNewFiles) return;
-
-  const files = Array.from(fileInput.files);
-  const listLabel = document.createElement('span');
-  listLabel.className = 'label';
-  listLabel.textContent = 'Ausgewählte Dateien';
-  filePreview.appendChild(listLabel);
-
-  files.forEach((file, index) => {
-    const chip = document.createElement('span');
-    chip.className = 'file-chip';
-    chip.textContent = file.name;
-
-    const remove = document.createElement('button');
-    remove.type = 'button';
-    remove.textContent = '×';
-    remove.addEventListener('click', () => removeFile(index));
-    chip.appendChild(remove);
-    filePreview.appendChild(chip);
-  });
+  if (hasNewFiles) {
+    const files = Array.from(fileInput.files);
+    const listLabel = document.createElement('span');
+    listLabel.className = 'label';
+    listLabel.textContent = 'Ausgewählte Dateien';
+    fragment.appendChild(listLabel);
+
+    files.forEach((file, index) => {
+      const chip = document.createElement('span');
+      chip.className = 'file-chip';
+      chip.textContent = file.name;
+
+      const remove = document.createElement('button');
+      remove.type = 'button';
+      remove.textContent = '×';
+      remove.addEventListener('click', () => removeFile(index));
+      chip.appendChild(remove);
+      fragment.appendChild(chip);
+    });
+  }
+
+  filePreview.replaceChildren(fragment);
 }
 
 function removeFile(index) {
@@ -530,7 +560,7 @@ function openJobModal(job = {}) {
 
   modalTitle.textContent = editingJobId ? 'Auftrag bearbeiten' : 'Auftrag anlegen';
 
-  jobForm.elements.date.value = data.date || formatDateInput(currentDate);
+  jobForm.elements.date.value = data.date || formatDateKey(currentDate);
   jobForm.elements.time.value = data.time || '';
   jobForm.elements.category.value = data.category || 'routine';
   jobForm.elements.title.value = data.title || '';
@@ -558,7 +588,7 @@ function openDetailModal(job) {
   detailGrid.className = 'detail-grid';
 
   const items = [
-    { label: 'Datum', value: new Date(data.date).toLocaleDateString('de-DE') },
+    { label: 'Datum', value: DATE_FORMATS.short.format(new Date(data.date)) },
     { label: 'Uhrzeit', value: data.time || 'Ganztägig' },
     { label: 'Bereich', value: CATEGORY_CONFIG[data.category]?.title || '' },
     { label: 'Kunde', value: data.customer || '–' },
@@ -683,9 +713,9 @@ async function addJobToClipboard(job) {
   try {
     const item = await api.createClipboard({
       title: job.title,
-      notes: `${job.customer || 'Kunde'} • ${new Date(job.date).toLocaleDateString('de-DE')}`,
+      notes: `${job.customer || 'Kunde'} • ${DATE_FORMATS.short.format(new Date(job.date))}`,
     });
-    state.clipboard.push(item);
+    state.clipboard.unshift(item);
     renderClipboard();
   } catch (error) {
     console.error(error);
@@ -695,7 +725,7 @@ async function addJobToClipboard(job) {
 
 function changeDay(offset) {
   currentDate.setDate(currentDate.getDate() + offset);
-  render();
+  scheduleRender();
 }
 
 function showDayView() {
@@ -703,6 +733,7 @@ function showDayView() {
   document.getElementById('week-view-btn').classList.remove('active');
   dayView.classList.remove('hidden');
   weekView.classList.add('hidden');
+  renderDayView();
 }
 
 function showWeekView() {
@@ -710,6 +741,7 @@ function showWeekView() {
   document.getElementById('day-view-btn').classList.remove('active');
   weekView.classList.remove('hidden');
   dayView.classList.add('hidden');
+  renderWeekView();
 }
 
 function statusColor(status) {
@@ -733,8 +765,7 @@ function getJobsForDay(date, category) {
   const dayKey = formatDateKey(date);
   const bucket = state.jobsByDay.get(dayKey);
   if (!bucket) return [];
-  const jobs = bucket[category] || [];
-  return [...jobs].sort((a, b) => (a.time || '').localeCompare(b.time || ''));
+  return bucket[category] || [];
 }
 
 function upsertJob(job) {
@@ -757,10 +788,19 @@ function upsertJob(job) {
   }
 
   const bucket = state.jobsByDay.get(job.date);
-  bucket[job.category].push(job);
+  insertByTime(bucket[job.category], job);
   state.jobsById.set(job.id, job);
 }
 
+function insertByTime(jobs, job) {
+  const time = job.time || '';
+  let index = jobs.length;
+  while (index > 0 && (jobs[index - 1].time || '') > time) {
+    index--;
+  }
+  jobs.splice(index, 0, job);
+}
+
 function removeJobFromState(jobId) {
   const job = state.jobsById.get(jobId);
   if (!job) return;
@@ -781,13 +821,9 @@ function findJob(jobId) {
 }
 
 function formatDateKey(date) {
-  const clone = new Date(date);
-  clone.setHours(0, 0, 0, 0);
-  return clone.toISOString().split('T')[0];
-}
-
-function formatDateInput(date) {
-  return formatDateKey(date);
+  const month = String(date.getMonth() + 1).padStart(2, '0');
+  const day = String(date.getDate()).padStart(2, '0');
+  return `${date.getFullYear()}-${month}-${day}`;
 }
 
 function getMonday(date) {
@@ -26,27 +26,27 @@ const upload = multer({ storage });
 
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
-app.use('/uploads', express.static(uploadDir));
+app.use('/uploads', express.static(uploadDir, { immutable: true, maxAge: '1y' }));
 app.use(express.static(path.join(__dirname, 'public')));
 
 const JOB_COLUMNS = `
   id,
   date,
-  time,
+  COALESCE(time, '') AS time,
   category,
   title,
-  customer,
-  contact,
-  vehicle,
-  license,
-  notes,
+  COALESCE(customer, '') AS customer,
+  COALESCE(contact, '') AS contact,
+  COALESCE(vehicle, '') AS vehicle,
+  COALESCE(license, '') AS license,
+  COALESCE(notes, '') AS notes,
   status,
-  created_at,
-  updated_at
+  created_at AS createdAt,
+  updated_at AS updatedAt
 `;
 
 const selectJobById = db.prepare(`SELECT ${JOB_COLUMNS} FROM jobs WHERE id = ?`);
-const selectAllJobs = db.prepare(`SELECT ${JOB_COLUMNS} FROM jobs ORDER BY date, time`);
+const selectAllJobs = db.prepare(`SELECT ${JOB_COLUMNS} FROM jobs ORDER BY jobs.date, jobs.time`);
 const insertJobStmt = db.prepare(
   `INSERT INTO jobs (date, time, category, title, customer, contact, vehicle, license, notes, status)
    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`
@@ -67,13 +67,16 @@ const updateJobStmt = db.prepare(
    WHERE id = ?`
 );
 const updateStatusStmt = db.prepare(
-  'UPDATE jobs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?'
+  `UPDATE jobs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING ${JOB_COLUMNS}`
 );
 const deleteJobStmt = db.prepare('DELETE FROM jobs WHERE id = ?');
 const deleteAttachmentsStmt = db.prepare('DELETE FROM attachments WHERE job_id = ?');
 const selectAttachmentsForJob = db.prepare(
   'SELECT id, original_name, stored_name, mime_type, size FROM attachments WHERE job_id = ? ORDER BY id'
 );
+const selectAllAttachments = db.prepare(
+  'SELECT id, job_id, original_name, stored_name, mime_type, size FROM attachments ORDER BY id'
+);
 const insertAttachmentStmt = db.prepare(
   `INSERT INTO attachments (job_id, original_name, stored_name, mime_type, size)
    VALUES (?, ?, ?, ?, ?)`
@@ -81,17 +84,17 @@ const insertAttachmentStmt = db.prepare(
 const selectClipboard = db.prepare(
   'SELECT id, title, notes, created_at FROM clipboard ORDER BY created_at DESC, id DESC'
 );
-const selectClipboardById = db.prepare(
-  'SELECT id, title, notes, created_at FROM clipboard WHERE id = ?'
-);
 const insertClipboardStmt = db.prepare(
-  'INSERT INTO clipboard (title, notes) VALUES (?, ?)'
+  'INSERT INTO clipboard (title, notes) VALUES (?, ?) RETURNING id, title, notes, created_at'
 );
 const deleteClipboardStmt = db.prepare('DELETE FROM clipboard WHERE id = ?');
 
 app.get('/api/jobs', (_req, res, next) => {
   try {
-    const jobs = selectAllJobs.all().map(attachJobResources);
+    const attachmentsByJob = groupAttachmentsByJob(selectAllAttachments.all());
+    const jobs = selectAllJobs.all().map((row) =>
+      mapJobRow(row, attachmentsByJob.get(row.id) || []),
+    );
     res.json(jobs);
   } catch (error) {
     next(error);
@@ -140,14 +143,12 @@ app.patch('/api/jobs/:id/status', (req, res, next) => {
   try {
     const jobId = parseId(req.params.id);
     const status = validateStatus(req.body.status);
-    const existing = selectJobById.get(jobId);
-    if (!existing) {
+    const row = updateStatusStmt.get(status, jobId);
+    if (!row) {
       throw createHttpError(404, 'Auftrag wurde nicht gefunden.');
     }
 
-    updateStatusStmt.run(status, jobId);
-    const job = getJobById(jobId);
-    res.json(job);
+    res.json(attachJobResources(row));
   } catch (error) {
     next(error);
   }
@@ -156,11 +157,6 @@ app.patch('/api/jobs/:id/status', (req, res, next) => {
 app.delete('/api/jobs/:id', (req, res, next) => {
   try {
     const jobId = parseId(req.params.id);
-    const existing = selectJobById.get(jobId);
-    if (!existing) {
-      throw createHttpError(404, 'Auftrag wurde nicht gefunden.');
-    }
-
     const attachments = selectAttachmentsForJob.all(jobId);
     const result = deleteJobStmt.run(jobId);
     if (!result.changes) {
@@ -188,8 +184,7 @@ app.post('/api/clipboard', (req, res, next) => {
   try {
     const title = ensureText(req.body.title, 'Titel ist erforderlich.');
     const notes = ensureText(req.body.notes, 'Bitte geben Sie eine Notiz ein.');
-    const result = insertClipboardStmt.run(title, notes);
-    const item = selectClipboardById.get(result.lastInsertRowid);
+    const item = insertClipboardStmt.get(title, notes);
     res.status(201).json(mapClipboardRow(item));
   } catch (error) {
     next(error);
@@ -217,8 +212,10 @@ app.get('*', (req, res, next) => {
 });
 
 app.use((err, _req, res, _next) => {
-  console.error(err);
   const status = Number.isInteger(err.status) ? err.status : 500;
+  if (status >= 500) {
+    console.error(err);
+  }
   const message = err.message || 'Interner Serverfehler.';
   res.status(status).json({ error: message });
 });
@@ -293,22 +290,25 @@ function getJobById(jobId) {
 
 function attachJobResources(row) {
   const attachments = selectAttachmentsForJob.all(row.id).map(mapAttachmentRow);
-  return {
-    id: row.id,
-    date: row.date,
-    time: row.time || '',
-    category: row.category,
-    title: row.title,
-    customer: row.customer || '',
-    contact: row.contact || '',
-    vehicle: row.vehicle || '',
-    license: row.license || '',
-    notes: row.notes || '',
-    status: row.status,
-    createdAt: row.created_at,
-    updatedAt: row.updated_at,
-    attachments,
-  };
+  return mapJobRow(row, attachments);
+}
+
+function groupAttachmentsByJob(rows) {
+  const attachmentsByJob = new Map();
+  rows.forEach((row) => {
+    const attachments = attachmentsByJob.get(row.job_id);
+    if (attachments) {
+      attachments.push(mapAttachmentRow(row));
+    } else {
+      attachmentsByJob.set(row.job_id, [mapAttachmentRow(row)]);
+    }
+  });
+  return attachmentsByJob;
+}
+
+function mapJobRow(row, attachments) {
+  row.attachments = attachments;
+  return row;
 }
 
 function mapAttachmentRow(row) {